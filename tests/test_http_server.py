@@ -0,0 +1,236 @@
+"""
+Tests for the HTTP time server
+"""
+
+import json
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+from time_mcp_server._tz_lookup import resolve_timezone
+from time_mcp_server.http_server import create_app
+
+
+class TestStatusEndpoints:
+    """Tests for the / and /health endpoints"""
+
+    def setup_method(self):
+        """Setup test client"""
+        self.client = TestClient(create_app())
+
+    def test_status_bodies(self):
+        """Test that / and /health return their fields in the usual order"""
+        expected_keys = {
+            "/": ["service", "version", "status", "timestamp"],
+            "/health": ["status", "service", "version", "timestamp"],
+        }
+        for path, keys in expected_keys.items():
+            response = self.client.get(path)
+
+            assert response.status_code == 200
+            data = response.json()
+            assert list(data) == keys
+            assert data["status"] == "healthy"
+            assert data["service"] == "time-mcp-server"
+            assert datetime.fromisoformat(data["timestamp"]).tzinfo is None
+
+
+class TestMCPEndpoint:
+    """Tests for the /mcp JSON-RPC endpoint"""
+
+    def setup_method(self):
+        """Setup test client"""
+        self.client = TestClient(create_app())
+
+    def test_single_request(self):
+        """Test a single JSON-RPC request"""
+        response = self.client.post(
+            "/mcp", json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == 1
+        tool_names = [tool["name"] for tool in data["result"]["tools"]]
+        assert tool_names == ["get_current_time", "list_timezones"]
+
+    def test_batch_request(self):
+        """Test a JSON-RPC batch request"""
+        response = self.client.post(
+            "/mcp",
+            json=[
+                {"jsonrpc": "2.0", "id": 1, "method": "initialize"},
+                {
+                    "jsonrpc": "2.0",
+                    "id": 2,
+                    "method": "tools/call",
+                    "params": {
+                        "name": "get_current_time",
+                        "arguments": {"timezone": "Japan"},
+                    },
+                },
+                {"jsonrpc": "2.0", "id": 3, "method": "unknown"},
+                {"jsonrpc": "2.0", "id": 4},
+            ],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data] == [1, 2, 3, 4]
+        assert data[0]["result"]["serverInfo"]["name"] == "time-mcp-server"
+        time_data = json.loads(data[1]["result"]["content"][0]["text"])
+        assert time_data["timezone"] == "Asia/Tokyo"
+        assert data[2]["error"]["code"] == -32601
+        assert data[3]["error"]["code"] == -32600
+
+    def test_empty_batch(self):
+        """Test an empty JSON-RPC batch request"""
+        response = self.client.post("/mcp", json=[])
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == -32600
+
+    def test_notifications_get_no_response(self):
+        """Test that calls without an id are not answered"""
+        notification = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+
+        response = self.client.post("/mcp", json=notification)
+        assert response.status_code == 202
+        assert response.content == b""
+
+        response = self.client.post(
+            "/mcp", json=[notification, {"jsonrpc": "2.0", "method": "initialize"}]
+        )
+        assert response.status_code == 202
+        assert response.content == b""
+
+        response = self.client.post(
+            "/mcp",
+            json=[notification, {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}],
+        )
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == [1]
+
+    def test_id_wider_than_64_bits(self):
+        """Test that ids orjson cannot encode are still echoed back"""
+        big_id = 99999999999999999999
+        response = self.client.post(
+            "/mcp", json={"jsonrpc": "2.0", "id": big_id, "method": "initialize"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["id"] == big_id
+
+        response = self.client.post(
+            "/mcp",
+            json=[
+                {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+                {"jsonrpc": "2.0", "id": big_id, "method": "unknown"},
+            ],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data] == [1, big_id]
+        assert data[1]["error"]["code"] == -32601
+
+
+class TestTimeEndpoint:
+    """Tests for the /time/{timezone} endpoint"""
+
+    def setup_method(self):
+        """Setup test client"""
+        self.client = TestClient(create_app())
+
+    def test_timezone_name_is_case_insensitive(self):
+        """Test that timezone names are accepted in any casing"""
+        response = self.client.get("/time/utc")
+
+        assert response.status_code == 200
+        assert response.json()["utc_offset"] == "+0000"
+
+    def test_timezone_and_country_resolution(self):
+        """Test that zone names resolve directly and country names to their main zone"""
+        expected = {
+            "Japan": "Asia/Tokyo",
+            "Iceland": "Iceland",
+            "EST": "EST",
+            "london": "Europe/London",
+        }
+        for name, timezone in expected.items():
+            response = self.client.get(f"/time/{name}")
+            assert response.status_code == 200
+            assert response.json()["timezone"] == timezone
+
+    def test_invalid_timezone(self):
+        """Test that unknown timezone names are rejected"""
+        response = self.client.get("/time/Nowhere")
+
+        assert response.status_code == 400
+        assert "Invalid timezone" in response.json()["detail"]
+
+    def test_tz_database_files_are_not_zones(self):
+        """Test that tz database entries outside the zone listing are rejected"""
+        for name in [
+            "localtime",
+            "Factory",
+            "posixrules",
+            "posix/Asia/Tokyo",
+            "right/UTC",
+        ]:
+            assert resolve_timezone(name) is None
+
+        response = self.client.get("/time/localtime")
+
+        assert response.status_code == 400
+
+
+class TestTimezonesEndpoint:
+    """Tests for the /timezones endpoint"""
+
+    def setup_method(self):
+        """Setup test client"""
+        self.client = TestClient(create_app())
+
+    def test_full_listing_is_compressed(self):
+        """Test that the full timezone listing is gzip-compressed"""
+        response = self.client.get("/timezones", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        data = response.json()
+        assert data["query"] == "all"
+        assert "Asia/Tokyo" in data["timezones"]
+
+    def test_small_response_is_not_compressed(self):
+        """Test that small responses are sent uncompressed"""
+        response = self.client.get(
+            "/timezones",
+            params={"country": "Japan"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.json()["timezones"] == ["Asia/Tokyo"]
+
+    def test_full_listing_not_modified(self):
+        """Test that a matching If-None-Match gets a 304 without a body"""
+        response = self.client.get("/timezones")
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        assert response.headers["cache-control"] == "public, max-age=86400"
+        assert response.headers["vary"] == "Accept-Encoding"
+
+        for if_none_match in (etag, etag[2:]):
+            response = self.client.get(
+                "/timezones", headers={"If-None-Match": if_none_match}
+            )
+
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["etag"] == etag
+            assert response.headers["vary"] == "Accept-Encoding"
+
+        response = self.client.get("/timezones", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
@@ -0,0 +1,77 @@
+"""
+Tests for the stdio MCP time server
+"""
+
+import json
+
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from time_mcp_server._tz import all_timezones
+from time_mcp_server.server import TimeServer, TimeServerError
+
+
+class TestTimeServer:
+    """Tests for TimeServer tool handlers"""
+
+    def setup_method(self):
+        """Setup test server"""
+        self.server = TimeServer()
+
+    @pytest.mark.asyncio
+    async def test_get_current_time(self):
+        """Test current time for country names and zone names in any casing"""
+        expected = {"Japan": "Asia/Tokyo", "asia/kolkata": "Asia/Kolkata"}
+        for name, timezone in expected.items():
+            result = await self.server._handle_get_current_time({"timezone": name})
+
+            data = json.loads(result[0].text)
+            assert data["timezone"] == timezone
+            assert list(data) == [
+                "timezone",
+                "current_time",
+                "timezone_name",
+                "utc_offset",
+                "timestamp",
+                "iso_string",
+            ]
+
+    @pytest.mark.asyncio
+    async def test_get_current_time_invalid(self):
+        """Test current time with missing or unknown timezone"""
+        with pytest.raises(TimeServerError, match="Timezone parameter is required"):
+            await self.server._handle_get_current_time({})
+
+        with pytest.raises(TimeServerError, match="Invalid timezone: Nowhere"):
+            await self.server._handle_get_current_time({"timezone": "Nowhere"})
+
+    @pytest.mark.asyncio
+    async def test_list_timezones(self):
+        """Test the full listing and a country listing"""
+        result = await self.server._handle_list_timezones({})
+        data = json.loads(result[0].text)
+        assert data["query"] == "all"
+        assert data["timezones"] == list(all_timezones())
+        assert data["total_timezones"] == len(data["timezones"])
+
+        result = await self.server._handle_list_timezones({"country": "Japan"})
+        data = json.loads(result[0].text)
+        assert data == {
+            "query": "Japan",
+            "total_timezones": 1,
+            "timezones": ["Asia/Tokyo"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self):
+        """Test that tools missing from the dispatch table are reported as errors"""
+        handler = self.server.server.request_handlers[CallToolRequest]
+        request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name="bogus", arguments={}),
+        )
+
+        result = await handler(request)
+
+        assert result.root.isError
+        assert result.root.content[0].text == "Unknown tool: bogus"
@@ -4,6 +4,7 @@ Tests for the standalone time server
 
 import asyncio
 import json
+import time
 import pytest
 from datetime import datetime
 
@@ -23,24 +24,60 @@ class TestSimpleTimezone:
     def test_get_current_time(self):
         """Test current time retrieval"""
         result = SimpleTimezone.get_current_time("UTC")
-        
+
         assert "timezone" in result
         assert "current_time" in result
         assert "timezone_name" in result
         assert "utc_offset" in result
         assert "timestamp" in result
         assert "iso_string" in result
-        
+
         assert result["timezone"] == "UTC"
         assert result["utc_offset"] == "+0000"
 
+    def test_get_current_time_timestamp(self):
+        """Test that the timestamp is the UTC epoch regardless of timezone"""
+        before = int(time.time())
+        result = SimpleTimezone.get_current_time("Asia/Tokyo")
+        after = int(time.time())
+
+        assert before <= result["timestamp"] <= after
+
     def test_get_current_time_with_format(self):
         """Test current time with custom format"""
         result = SimpleTimezone.get_current_time("UTC", "%Y/%m/%d")
-        
+
         # Check that the format is applied
         assert len(result["current_time"].split("/")) == 3
 
+    def test_get_current_time_returns_fresh_dict(self):
+        """Test that cached results are not shared between callers"""
+        result = SimpleTimezone.get_current_time("Asia/Tokyo")
+        result["timezone"] = "changed"
+
+        result = SimpleTimezone.get_current_time("Asia/Tokyo")
+        assert result["timezone"] == "Asia/Tokyo"
+        assert result["utc_offset"] == "+0900"
+
+    def test_get_current_time_with_fields(self):
+        """Test current time limited to selected fields"""
+        full = SimpleTimezone.get_current_time("Asia/Kolkata", utc_epoch_second=0)
+        result = SimpleTimezone.get_current_time(
+            "Asia/Kolkata", utc_epoch_second=0, fields={"iso_string", "utc_offset"}
+        )
+
+        assert list(result) == ["utc_offset", "iso_string"]
+        assert result["utc_offset"] == full["utc_offset"] == "+0530"
+        assert result["iso_string"] == full["iso_string"] == "1970-01-01T05:30:00"
+
+        with pytest.raises(ValueError, match="Unknown fields"):
+            SimpleTimezone.get_current_time("UTC", fields={"bogus"})
+
+        result = SimpleTimezone.get_current_time(
+            "UTC", utc_epoch_second=0, fields={"timestamp": None}.keys()
+        )
+        assert result == {"timestamp": 0}
+
     def test_get_current_time_invalid_timezone(self):
         """Test current time with invalid timezone"""
         with pytest.raises(ValueError, match="Unknown timezone"):
@@ -49,12 +86,12 @@ class TestSimpleTimezone:
     def test_list_timezones(self):
         """Test timezone listing"""
         timezones = SimpleTimezone.list_timezones()
-        
+
         assert isinstance(timezones, list)
         assert len(timezones) > 0
         assert "UTC" in timezones
         assert "Asia/Tokyo" in timezones
-        
+
         # Check that list is sorted
         assert timezones == sorted(timezones)
 
@@ -71,11 +108,11 @@ class TestTimeServerStandalone:
         # Test direct mapping
         japan_timezones = self.server.get_timezones_by_country("Japan")
         assert "Asia/Tokyo" in japan_timezones
-        
+
         usa_timezones = self.server.get_timezones_by_country("United States")
         assert "America/New_York" in usa_timezones
         assert "America/Los_Angeles" in usa_timezones
-        
+
         # Test case insensitive
         uk_timezones = self.server.get_timezones_by_country("uk")
         assert "Europe/London" in uk_timezones
@@ -86,19 +123,37 @@ class TestTimeServerStandalone:
         result = self.server.get_current_time("UTC")
         assert isinstance(result, dict)
         assert result["timezone"] == "UTC"
-        
+
         # Test with country
         result = self.server.get_current_time("Japan")
         assert result["timezone"] == "Asia/Tokyo"
 
+    def test_get_current_times(self):
+        """Test batch current time retrieval"""
+        results = self.server.get_current_times(["Japan", "UTC", "Asia/Kolkata"])
+
+        assert [result["timezone"] for result in results] == [
+            "Asia/Tokyo",
+            "UTC",
+            "Asia/Kolkata",
+        ]
+        # All entries come from the same clock read
+        assert len({result["timestamp"] for result in results}) == 1
+
+        with pytest.raises(ValueError):
+            self.server.get_current_times(["UTC", "Invalid/Country"])
+
     def test_get_current_time_invalid(self):
         """Test current time with invalid input"""
         with pytest.raises(ValueError):
             self.server.get_current_time("")
-        
+
         with pytest.raises(ValueError):
             self.server.get_current_time("Invalid/Country")
 
+        with pytest.raises(ValueError, match="Unknown fields: bogus$"):
+            self.server.get_current_time("Japan", fields={"bogus"})
+
     def test_list_timezones(self):
         """Test timezone listing"""
         # Test all timezones
@@ -107,7 +162,7 @@ class TestTimeServerStandalone:
         assert "total_timezones" in result
         assert "timezones" in result
         assert result["query"] == "all"
-        
+
         # Test country filter
         result = self.server.list_timezones("Japan")
         assert result["query"] == "Japan"
@@ -117,10 +172,9 @@ class TestTimeServerStandalone:
     async def test_handle_tool_call_get_current_time(self):
         """Test tool call handling for get_current_time"""
         result = await self.server.handle_tool_call(
-            "get_current_time",
-            {"timezone": "UTC"}
+            "get_current_time", {"timezone": "UTC"}
         )
-        
+
         data = json.loads(result)
         assert "timezone" in data
         assert data["timezone"] == "UTC"
@@ -129,36 +183,55 @@ class TestTimeServerStandalone:
     async def test_handle_tool_call_list_timezones(self):
         """Test tool call handling for list_timezones"""
         result = await self.server.handle_tool_call(
-            "list_timezones",
-            {"country": "Japan"}
+            "list_timezones", {"country": "Japan"}
         )
-        
+
         data = json.loads(result)
         assert "timezones" in data
         assert "Asia/Tokyo" in data["timezones"]
 
+    def test_handle_tool_call_sync(self):
+        """Test synchronous tool call handling"""
+        result = self.server.handle_tool_call_sync(
+            "get_current_time", {"timezone": "Japan"}
+        )
+
+        data = json.loads(result)
+        assert data["timezone"] == "Asia/Tokyo"
+
     @pytest.mark.asyncio
-    async def test_handle_tool_call_invalid_tool(self):
-        """Test tool call handling for invalid tool"""
+    async def test_handle_tool_call_pretty_output(self, monkeypatch):
+        """Test compact tool output by default and indented output with TIME_MCP_PRETTY"""
         result = await self.server.handle_tool_call(
-            "invalid_tool",
-            {}
+            "list_timezones", {"country": "Japan"}
         )
-        
+        assert "\n" not in result
+
+        monkeypatch.setenv("TIME_MCP_PRETTY", "1")
+        server = TimeServerStandalone()
+        result = await server.handle_tool_call("list_timezones", {"country": "Japan"})
+        assert result.startswith("{\n  ")
+        assert json.loads(result)["timezones"] == ["Asia/Tokyo"]
+
+    @pytest.mark.asyncio
+    async def test_handle_tool_call_invalid_tool(self):
+        """Test tool call handling for invalid tool"""
+        result = await self.server.handle_tool_call("invalid_tool", {})
+
         data = json.loads(result)
         assert "error" in data
 
     def test_get_tools(self):
         """Test tool definition retrieval"""
         tools = self.server.get_tools()
-        
+
         assert isinstance(tools, list)
         assert len(tools) == 2
-        
+
         tool_names = [tool["name"] for tool in tools]
         assert "get_current_time" in tool_names
         assert "list_timezones" in tool_names
-        
+
         # Check tool structure
         for tool in tools:
             assert "name" in tool
@@ -0,0 +1,51 @@
+"""
+Tests for the shared time formatting helpers
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from time_mcp_server._time_format import (
+    DEFAULT_TIME_FORMAT,
+    fast_format,
+    format_utc_offset,
+)
+
+
+class TestFastFormat:
+    """Tests for fast_format"""
+
+    def setup_method(self):
+        """Setup sample datetimes"""
+        self.samples = [
+            datetime(2024, 1, 5, 3, 4, 5, 60, tzinfo=timezone.utc),
+            datetime(
+                2024,
+                12,
+                31,
+                23,
+                59,
+                59,
+                tzinfo=timezone(timedelta(hours=5, minutes=30), "IST"),
+            ),
+            datetime(2024, 7, 1, 12, 0, 0, tzinfo=timezone(timedelta(hours=-4), "EDT")),
+        ]
+
+    def test_matches_strftime(self):
+        """Test that formats render the same as strftime"""
+        formats = [
+            DEFAULT_TIME_FORMAT,
+            "%Y/%m/%d %I:%M %p",
+            "%a %b %d %H:%M:%S.%f %Z %z",
+            "%%Y is %Y",
+            "%Y %:z",
+            "plain text",
+        ]
+        for dt in self.samples:
+            for fmt in formats:
+                assert fast_format(dt, fmt) == dt.strftime(fmt)
+
+    def test_format_utc_offset(self):
+        """Test that UTC offsets render like %z"""
+        for dt in self.samples:
+            assert format_utc_offset(dt) == dt.strftime("%z")
+        assert format_utc_offset(datetime(2024, 1, 1)) == ""
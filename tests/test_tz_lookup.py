@@ -0,0 +1,28 @@
+"""
+Tests for the country to timezone lookup
+"""
+
+from time_mcp_server._country_data import COUNTRY_TIMEZONES, EXTENDED_TIMEZONES
+from time_mcp_server._tz_lookup import get_timezones_by_country
+
+
+class TestGetTimezonesByCountry:
+    """Tests for get_timezones_by_country"""
+
+    def test_matches_linear_scan(self):
+        """Test that the token and trigram indexes match a plain substring scan"""
+        queries = {"zzz", "xq", "asia/tokyo/x"}
+        for tz in EXTENDED_TIMEZONES:
+            tz_lower = tz.lower()
+            for start in range(len(tz_lower)):
+                for end in range(start + 1, len(tz_lower) + 1):
+                    queries.add(tz_lower[start:end])
+
+        for query in sorted(queries - set(COUNTRY_TIMEZONES)):
+            expected = tuple(tz for tz in EXTENDED_TIMEZONES if query in tz.lower())
+            assert get_timezones_by_country(query) == expected, query
+
+    def test_country_names_win(self):
+        """Test that country names map to their own zones, main zone first"""
+        for country, timezones in COUNTRY_TIMEZONES.items():
+            assert get_timezones_by_country(country) == timezones
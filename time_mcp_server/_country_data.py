@@ -0,0 +1,184 @@
+"""
+Country and timezone lookup data
+
+Static tables shared by the HTTP, MCP and standalone servers, built once at import.
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+# Timezones of countries listed under more than one name
+_US_TZS = (
+    "America/New_York",
+    "America/Chicago",
+    "America/Denver",
+    "America/Los_Angeles",
+    "America/Anchorage",
+    "Pacific/Honolulu",
+)
+_UK_TZS = ("Europe/London",)
+_KOREA_TZS = ("Asia/Seoul",)
+
+# Country name -> timezones, main timezone first
+COUNTRY_TIMEZONES: Dict[str, Tuple[str, ...]] = {
+    "utc": ("UTC",),
+    "gmt": ("GMT", "UTC"),
+    "japan": ("Asia/Tokyo",),
+    "united states": _US_TZS,
+    "usa": _US_TZS,
+    "china": ("Asia/Shanghai", "Asia/Hong_Kong"),
+    "united kingdom": _UK_TZS,
+    "uk": _UK_TZS,
+    "germany": ("Europe/Berlin",),
+    "france": ("Europe/Paris",),
+    "italy": ("Europe/Rome",),
+    "spain": ("Europe/Madrid",),
+    "australia": (
+        "Australia/Sydney",
+        "Australia/Melbourne",
+        "Australia/Perth",
+        "Australia/Adelaide",
+        "Australia/Darwin",
+    ),
+    "canada": (
+        "America/Toronto",
+        "America/Vancouver",
+        "America/Edmonton",
+        "America/Winnipeg",
+        "America/Halifax",
+    ),
+    "india": ("Asia/Kolkata", "Asia/Mumbai"),
+    "brazil": ("America/Sao_Paulo",),
+    "russia": ("Europe/Moscow",),
+    "south korea": _KOREA_TZS,
+    "korea": _KOREA_TZS,
+    "mexico": ("America/Mexico_City",),
+    "argentina": ("America/Buenos_Aires",),
+    "egypt": ("Africa/Cairo",),
+    "south africa": ("Africa/Johannesburg",),
+    "new zealand": ("Pacific/Auckland",),
+    "singapore": ("Asia/Singapore",),
+    "thailand": ("Asia/Bangkok",),
+    "indonesia": ("Asia/Jakarta",),
+    "pakistan": ("Asia/Karachi",),
+    "uae": ("Asia/Dubai",),
+    "netherlands": ("Europe/Amsterdam",),
+    "belgium": ("Europe/Brussels",),
+    "austria": ("Europe/Vienna",),
+    "switzerland": ("Europe/Zurich",),
+    "sweden": ("Europe/Stockholm",),
+    "norway": ("Europe/Oslo",),
+    "denmark": ("Europe/Copenhagen",),
+    "finland": ("Europe/Helsinki",),
+    "turkey": ("Europe/Istanbul",),
+    "greece": ("Europe/Athens",),
+    "peru": ("America/Lima",),
+    "colombia": ("America/Bogota",),
+    "chile": ("America/Santiago",),
+    "venezuela": ("America/Caracas",),
+    "nigeria": ("Africa/Lagos",),
+    "kenya": ("Africa/Nairobi",),
+    "morocco": ("Africa/Casablanca",),
+}
+
+# Extended timezone list for fallback search
+EXTENDED_TIMEZONES: Tuple[str, ...] = (
+    "UTC",
+    "GMT",
+    "Asia/Tokyo",
+    "Asia/Seoul",
+    "Asia/Shanghai",
+    "Asia/Hong_Kong",
+    "Asia/Singapore",
+    "Asia/Bangkok",
+    "Asia/Jakarta",
+    "Asia/Kolkata",
+    "Asia/Mumbai",
+    "Asia/Dubai",
+    "Asia/Karachi",
+    "Australia/Sydney",
+    "Australia/Melbourne",
+    "Australia/Perth",
+    "Australia/Adelaide",
+    "Australia/Darwin",
+    "Pacific/Auckland",
+    "Pacific/Honolulu",
+    "Europe/London",
+    "Europe/Berlin",
+    "Europe/Paris",
+    "Europe/Rome",
+    "Europe/Madrid",
+    "Europe/Amsterdam",
+    "Europe/Brussels",
+    "Europe/Vienna",
+    "Europe/Zurich",
+    "Europe/Stockholm",
+    "Europe/Oslo",
+    "Europe/Copenhagen",
+    "Europe/Helsinki",
+    "Europe/Moscow",
+    "Europe/Istanbul",
+    "Europe/Athens",
+    "America/New_York",
+    "America/Chicago",
+    "America/Denver",
+    "America/Los_Angeles",
+    "America/Anchorage",
+    "America/Toronto",
+    "America/Vancouver",
+    "America/Edmonton",
+    "America/Winnipeg",
+    "America/Halifax",
+    "America/Mexico_City",
+    "America/Sao_Paulo",
+    "America/Buenos_Aires",
+    "America/Lima",
+    "America/Bogota",
+    "America/Santiago",
+    "America/Caracas",
+    "Africa/Cairo",
+    "Africa/Lagos",
+    "Africa/Johannesburg",
+    "Africa/Casablanca",
+    "Africa/Nairobi",
+)
+EXTENDED_TIMEZONES_LOWER: Tuple[Tuple[str, str], ...] = tuple(
+    (tz, tz.lower()) for tz in EXTENDED_TIMEZONES
+)
+
+
+def _build_substring_index() -> Dict[str, Tuple[str, ...]]:
+    """Map each lowercase name token (and full name) to the timezones containing it
+
+    Values are exactly what the fallback substring scan returns for that key,
+    so an index hit can be returned as-is.
+    """
+    keys = set()
+    for _, tz_lower in EXTENDED_TIMEZONES_LOWER:
+        keys.add(tz_lower)
+        keys.update(re.split(r"[/_]", tz_lower))
+    return {
+        key: tuple(tz for tz, tz_lower in EXTENDED_TIMEZONES_LOWER if key in tz_lower)
+        for key in keys
+    }
+
+
+SUBSTRING_INDEX = _build_substring_index()
+
+
+def _build_trigram_index() -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """Map every 3-character substring to the (tz, tz_lower) pairs containing it
+
+    Any query of 3+ characters is a substring of a name only if its first
+    trigram is, so the fallback scan can be narrowed to these candidates.
+    Candidates keep the order of EXTENDED_TIMEZONES.
+    """
+    index: Dict[str, List[Tuple[str, str]]] = {}
+    for pair in EXTENDED_TIMEZONES_LOWER:
+        tz_lower = pair[1]
+        for trigram in {tz_lower[i : i + 3] for i in range(len(tz_lower) - 2)}:
+            index.setdefault(trigram, []).append(pair)
+    return {trigram: tuple(pairs) for trigram, pairs in index.items()}
+
+
+TRIGRAM_INDEX = _build_trigram_index()
@@ -0,0 +1,55 @@
+"""
+Current time data
+
+get_current_time fields for a resolved timezone, shared by the HTTP route and
+the MCP tools of both servers. Results are memoized per (timezone, format,
+second), so repeated requests within the same second skip the formatting.
+"""
+
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import orjson
+
+from ._time_format import fast_format, format_utc_offset
+from ._tz import get_tz
+
+# Zero-offset zones served with fixed-offset tzinfo instead of a tz database lookup
+UTC_ZONES: Dict[str, tzinfo] = {
+    "UTC": timezone.utc,
+    "GMT": timezone(timedelta(0), "GMT"),
+}
+
+
+@lru_cache(maxsize=256)
+def format_time(tz_name: str, fmt: str, epoch_second: int) -> Tuple[str, str, str, str]:
+    """Format a UTC epoch second in a timezone
+
+    Returns (current_time, timezone_name, utc_offset, iso_string).
+    """
+    tz = UTC_ZONES.get(tz_name) or get_tz(tz_name)
+    local_time = datetime.fromtimestamp(epoch_second, tz)
+    return (
+        fast_format(local_time, fmt),
+        local_time.tzname() or "",
+        format_utc_offset(local_time),
+        local_time.isoformat(),
+    )
+
+
+@lru_cache(maxsize=256)
+def current_time_text(tz_name: str, fmt: str, epoch_second: int) -> str:
+    """Indented JSON get_current_time result, as returned by the MCP tools"""
+    current_time, timezone_name, utc_offset, iso_string = format_time(
+        tz_name, fmt, epoch_second
+    )
+    time_data = {
+        "timezone": tz_name,
+        "current_time": current_time,
+        "timezone_name": timezone_name,
+        "utc_offset": utc_offset,
+        "timestamp": epoch_second,
+        "iso_string": iso_string,
+    }
+    return orjson.dumps(time_data, option=orjson.OPT_INDENT_2).decode()
@@ -0,0 +1,109 @@
+"""
+Time formatting helpers
+
+strftime replacements shared by the HTTP and MCP servers. Formats are parsed
+once and rendered from datetime fields where possible.
+"""
+
+from datetime import datetime
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Union
+
+DEFAULT_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def format_utc_offset(dt: datetime) -> str:
+    """Format the UTC offset of a datetime the same way as strftime's %z"""
+    offset = dt.utcoffset()
+    if offset is None:
+        return ""
+
+    sign = "+"
+    if offset.days < 0:
+        sign = "-"
+        offset = -offset
+    minutes, seconds = divmod(offset.seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    result = f"{sign}{hours:02d}{minutes:02d}"
+    if seconds or offset.microseconds:
+        result += f"{seconds:02d}"
+        if offset.microseconds:
+            result += f".{offset.microseconds:06d}"
+    return result
+
+
+# strftime directives that can be rendered straight from datetime fields
+_DIRECTIVE_FORMATTERS: Dict[str, Callable[[datetime], str]] = {
+    "%Y": lambda dt: f"{dt.year:04d}",
+    "%y": lambda dt: f"{dt.year % 100:02d}",
+    "%m": lambda dt: f"{dt.month:02d}",
+    "%d": lambda dt: f"{dt.day:02d}",
+    "%H": lambda dt: f"{dt.hour:02d}",
+    "%I": lambda dt: f"{dt.hour % 12 or 12:02d}",
+    "%M": lambda dt: f"{dt.minute:02d}",
+    "%S": lambda dt: f"{dt.second:02d}",
+    "%f": lambda dt: f"{dt.microsecond:06d}",
+    "%z": format_utc_offset,
+    "%Z": lambda dt: dt.tzname() or "",
+    "%%": lambda dt: "%",
+}
+
+# Flags that may sit between "%" and the directive character (e.g. glibc's "%-d",
+# or ":" in Python 3.12's "%:z"); field widths such as "%5Y" are handled as well
+_DIRECTIVE_FLAGS = "-_0^#EO:"
+
+
+def _strftime_directive(dt: datetime, directive: str) -> str:
+    """Render a single directive via strftime"""
+    return dt.strftime(directive)
+
+
+@lru_cache(maxsize=64)
+def _compile_format(fmt: str) -> Callable[[datetime], str]:
+    """Compile a strftime format into a formatter so it is only parsed once
+
+    Directives without a direct formatter (locale-dependent names, flags, ...)
+    are delegated to strftime one at a time.
+    """
+    parts: List[Union[str, Callable[[datetime], str]]] = []
+    literal: List[str] = []
+    i = 0
+    while i < len(fmt):
+        char = fmt[i]
+        if char != "%":
+            literal.append(char)
+            i += 1
+            continue
+
+        end = i + 1
+        while end < len(fmt) and (fmt[end] in _DIRECTIVE_FLAGS or fmt[end].isdigit()):
+            end += 1
+        directive = fmt[i : end + 1]
+        i = end + 1
+
+        formatter = _DIRECTIVE_FORMATTERS.get(directive)
+        if formatter is None:
+            formatter = partial(_strftime_directive, directive=directive)
+        if literal:
+            parts.append("".join(literal))
+            literal = []
+        parts.append(formatter)
+
+    if literal:
+        parts.append("".join(literal))
+
+    def compiled(dt: datetime) -> str:
+        return "".join([part if isinstance(part, str) else part(dt) for part in parts])
+
+    return compiled
+
+
+def fast_format(dt: datetime, fmt: str) -> str:
+    """Format a datetime, bypassing strftime for the default format"""
+    if fmt == DEFAULT_TIME_FORMAT:
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+        )
+    return _compile_format(fmt)(dt)
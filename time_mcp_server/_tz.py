@@ -0,0 +1,96 @@
+"""
+Timezone backend
+
+Uses the stdlib zoneinfo module on Python 3.9+ and falls back to pytz on
+older interpreters. Both servers resolve timezone names through here.
+"""
+
+import sys
+from datetime import tzinfo
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Tuple, Type
+
+import orjson
+
+if sys.version_info >= (3, 9):
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+
+    UnknownTimeZoneError: Type[Exception] = ZoneInfoNotFoundError
+
+    # Keys present in the system tz database that are not real zones
+    _NON_ZONE_KEYS = frozenset({"Factory", "localtime", "posixrules"})
+
+    def _load_timezone_names() -> Tuple[str, ...]:
+        return tuple(sorted(available_timezones() - _NON_ZONE_KEYS))
+
+    @lru_cache(maxsize=None)
+    def _canonical_names() -> Dict[str, str]:
+        """Lowercased timezone name -> canonical name"""
+        return {name.lower(): name for name in all_timezones()}
+
+    def _load_timezone(name: str) -> tzinfo:
+        # Accept any casing of a listed name, as pytz did, but nothing else
+        # in the tz database directory ("localtime", "posix/...", "right/...")
+        canonical = _canonical_names().get(name.lower())
+        if canonical is None:
+            raise ZoneInfoNotFoundError(f"No time zone found with key {name}")
+        return ZoneInfo(canonical)
+
+else:
+    import pytz
+
+    UnknownTimeZoneError = pytz.UnknownTimeZoneError
+
+    def _load_timezone_names() -> Tuple[str, ...]:
+        return tuple(sorted(pytz.all_timezones))
+
+    def _load_timezone(name: str) -> tzinfo:
+        return pytz.timezone(name)
+
+
+@lru_cache(maxsize=512)
+def get_tz(name: str) -> tzinfo:
+    """Get a cached tzinfo for the given timezone name
+
+    Raises UnknownTimeZoneError if the name is not a known timezone.
+    """
+    return _load_timezone(name)
+
+
+@lru_cache(maxsize=None)
+def all_timezones() -> Tuple[str, ...]:
+    """All known timezone names, sorted"""
+    return _load_timezone_names()
+
+
+# The full listing is static, so it is built and serialized only once (on first use)
+@lru_cache(maxsize=1)
+def all_timezones_listing() -> Dict[str, Any]:
+    """list_timezones result for every known timezone"""
+    timezone_list = list(all_timezones())
+    return {
+        "query": "all",
+        "total_timezones": len(timezone_list),
+        "timezones": timezone_list,
+    }
+
+
+@lru_cache(maxsize=1)
+def all_timezones_json() -> str:
+    """Indented JSON text of all_timezones_listing(), as returned by the MCP tools"""
+    return orjson.dumps(all_timezones_listing(), option=orjson.OPT_INDENT_2).decode()
+
+
+def prewarm_timezones(names: Iterable[str]) -> int:
+    """Load timezones into the get_tz cache ahead of the first request
+
+    Unknown names are skipped. Returns the number of timezones loaded.
+    """
+    loaded = 0
+    for name in names:
+        try:
+            get_tz(name)
+        except UnknownTimeZoneError:
+            continue
+        loaded += 1
+    return loaded
@@ -0,0 +1,65 @@
+"""
+Country to timezone lookup
+
+Shared by the HTTP and MCP servers so both use one memoized lookup.
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from ._country_data import (
+    COUNTRY_TIMEZONES,
+    EXTENDED_TIMEZONES_LOWER,
+    SUBSTRING_INDEX,
+    TRIGRAM_INDEX,
+)
+from ._tz import UnknownTimeZoneError, get_tz
+
+
+@lru_cache(maxsize=256)
+def get_timezones_by_country(country_lower: str) -> Tuple[str, ...]:
+    """Get timezones for a lowercase country name, main timezone first
+
+    Callers lowercase the input once at the entry point.
+    """
+    # Direct mapping
+    if country_lower in COUNTRY_TIMEZONES:
+        return COUNTRY_TIMEZONES[country_lower]
+
+    # Common name tokens ("tokyo", "america", ...) are precomputed
+    indexed = SUBSTRING_INDEX.get(country_lower)
+    if indexed is not None:
+        return indexed
+
+    # Search in timezone names, narrowed by the query's first trigram
+    if len(country_lower) >= 3:
+        candidates = TRIGRAM_INDEX.get(country_lower[:3], ())
+    else:
+        candidates = EXTENDED_TIMEZONES_LOWER
+    return tuple(tz for tz, tz_lower in candidates if country_lower in tz_lower)
+
+
+@lru_cache(maxsize=256)
+def resolve_timezone(name: str) -> Optional[str]:
+    """Resolve a timezone or country name to a canonical timezone name
+
+    Exact country names are tried first, then timezone names, then the
+    country substring search. Returns None if nothing matches.
+    """
+    name_lower = name.lower()
+
+    # Country names win over same-named legacy zones ("Japan" -> "Asia/Tokyo")
+    country_timezones = COUNTRY_TIMEZONES.get(name_lower)
+    if not country_timezones:
+        try:
+            # str() of a zone is its canonical name, for zoneinfo and pytz alike
+            return str(get_tz(name))
+        except UnknownTimeZoneError:
+            country_timezones = get_timezones_by_country(name_lower)
+            if not country_timezones:
+                return None
+
+    try:
+        return str(get_tz(country_timezones[0]))
+    except UnknownTimeZoneError:
+        return None
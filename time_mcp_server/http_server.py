@@ -5,20 +5,166 @@ HTTP Server for Time MCP
 A FastAPI-based HTTP server that exposes time functionality via REST API.
 """
 
+import hashlib
 import json
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import pytz
+import msgspec
+import orjson
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
+
+from ._time_data import UTC_ZONES, current_time_text, format_time
+from ._time_format import DEFAULT_TIME_FORMAT
+from ._country_data import EXTENDED_TIMEZONES
+from ._tz import all_timezones_json, all_timezones_listing, prewarm_timezones
+from ._tz_lookup import get_timezones_by_country, resolve_timezone
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class TimeData(msgspec.Struct):
+    """Response body of /time/{timezone}"""
+
+    timezone: str
+    current_time: str
+    timezone_name: str
+    utc_offset: str
+    timestamp: int
+    iso_string: str
+
+
+_TIME_DATA_ENCODER = msgspec.json.Encoder()
+
+
+def _dumps(content: Any) -> bytes:
+    """Encode JSON with orjson, falling back to the stdlib for values orjson rejects
+
+    orjson only encodes integers up to 64 bits, but a JSON-RPC id can be wider.
+    """
+    try:
+        return orjson.dumps(content)
+    except orjson.JSONEncodeError:
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+@lru_cache(maxsize=1)
+def _status_bodies(epoch_second: int) -> Tuple[bytes, bytes]:
+    """JSON bodies of / and /health, reused within the same second"""
+    timestamp = (
+        datetime.fromtimestamp(epoch_second, timezone.utc)
+        .replace(tzinfo=None)
+        .isoformat()
+    )
+    root = {
+        "service": "time-mcp-server",
+        "version": "1.0.0",
+        "status": "healthy",
+        "timestamp": timestamp,
+    }
+    health = {
+        "status": "healthy",
+        "service": "time-mcp-server",
+        "version": "1.0.0",
+        "timestamp": timestamp,
+    }
+    return orjson.dumps(root), orjson.dumps(health)
+
+
+@lru_cache(maxsize=1)
+def _all_timezones_body() -> bytes:
+    """Compact JSON body for the full timezone listing"""
+    return orjson.dumps(all_timezones_listing())
+
+
+@lru_cache(maxsize=1)
+def _all_timezones_headers() -> Dict[str, str]:
+    """Caching headers for the full listing; the ETag is a hash of the body
+
+    The ETag is weak because GZipMiddleware may send the listing compressed
+    under the same tag.
+    """
+    etag = f'W/"{hashlib.sha256(_all_timezones_body()).hexdigest()[:32]}"'
+    return {"ETag": etag, "Cache-Control": "public, max-age=86400"}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    return any(
+        candidate.strip().replace("W/", "", 1) == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _is_notification(message: Any) -> bool:
+    """Check for a JSON-RPC notification: a call without an id, which gets no response"""
+    return isinstance(message, dict) and "method" in message and "id" not in message
+
+
+# MCP tool definitions exposed through tools/list
+_TOOLS_DEF: List[Dict[str, Any]] = [
+    {
+        "name": "get_current_time",
+        "description": "Get the current time for a specified timezone or country",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "timezone": {
+                    "type": "string",
+                    "description": "Timezone name (e.g., 'Asia/Tokyo', 'America/New_York') or country name (e.g., 'Japan', 'United States')",
+                },
+                "format": {
+                    "type": "string",
+                    "description": "Time format (optional, defaults to '%Y-%m-%d %H:%M:%S')",
+                    "default": "%Y-%m-%d %H:%M:%S",
+                },
+            },
+            "required": ["timezone"],
+        },
+    },
+    {
+        "name": "list_timezones",
+        "description": "List available timezones for a specific country or region",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "country": {
+                    "type": "string",
+                    "description": "Country name or country code to filter timezones (optional)",
+                },
+            },
+        },
+    },
+]
+
+# Static JSON-RPC results, serialized once; only the request id varies per call
+_INIT_RESULT: Dict[str, Any] = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {"tools": {}},
+    "serverInfo": {"name": "time-mcp-server", "version": "1.0.0"},
+}
+_TOOLS_RESULT: Dict[str, Any] = {"tools": _TOOLS_DEF}
+_INIT_RESULT_JSON = orjson.dumps(_INIT_RESULT)
+_TOOLS_RESULT_JSON = orjson.dumps(_TOOLS_RESULT)
+
+
 class TimeHTTPServer:
     """HTTP Server for time functionality"""
 
@@ -27,396 +173,304 @@ class TimeHTTPServer:
             title="Time MCP Server",
             description="HTTP API for time and timezone functionality",
             version="1.0.0",
+            default_response_class=ORJSONResponse,
         )
+        # Compress large bodies (the full /timezones listing); small ones stay as-is
+        self.app.add_middleware(GZipMiddleware, minimum_size=1024)
+        # JSON-RPC method -> handler(params, request_id) returning the encoded response
+        self._mcp_handlers: Dict[str, Callable[[Dict[str, Any], Any], bytes]] = {
+            "initialize": self._handle_mcp_initialize,
+            "tools/list": self._handle_mcp_tools_list,
+            "tools/call": self._handle_mcp_tools_call,
+        }
+        logger.info("Prewarmed %d timezones", prewarm_timezones(EXTENDED_TIMEZONES))
         self._setup_routes()
 
     def _setup_routes(self) -> None:
         """Setup HTTP routes"""
+        self.app.add_api_route("/", self._root, methods=["GET"], name="root")
+        self.app.add_api_route(
+            "/health", self._health, methods=["GET"], name="health_check"
+        )
+        self.app.add_api_route(
+            "/time/{timezone}", self._get_time, methods=["GET"], name="get_time"
+        )
+        self.app.add_api_route(
+            "/timezones", self._list_timezones, methods=["GET"], name="list_timezones"
+        )
+        self.app.add_api_route(
+            "/mcp", self._mcp_endpoint, methods=["POST"], name="mcp_endpoint"
+        )
 
-        @self.app.get("/")
-        async def root() -> Dict[str, str]:
-            """Root endpoint"""
-            return {
-                "service": "time-mcp-server",
-                "version": "1.0.0",
-                "status": "healthy",
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+    async def _root(self) -> Response:
+        """Root endpoint"""
+        return Response(
+            content=_status_bodies(int(time.time()))[0],
+            media_type="application/json",
+        )
 
-        @self.app.get("/health")
-        async def health_check() -> Dict[str, str]:
-            """Health check endpoint"""
-            return {
-                "status": "healthy",
-                "service": "time-mcp-server",
-                "version": "1.0.0",
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+    async def _health(self) -> Response:
+        """Health check endpoint"""
+        return Response(
+            content=_status_bodies(int(time.time()))[1],
+            media_type="application/json",
+        )
 
-        @self.app.get("/time/{timezone}")
-        async def get_time(
-            timezone: str, 
-            format: Optional[str] = Query(default="%Y-%m-%d %H:%M:%S", description="Time format")
-        ) -> JSONResponse:
-            """Get current time for specified timezone"""
-            try:
-                # Try to find timezone by name or country
-                target_timezone = timezone
-                
-                # If it's a country name, try to get the main timezone
-                country_timezones = self._get_timezones_by_country(timezone)
-                if country_timezones:
-                    target_timezone = country_timezones[0]
-
-                # Validate timezone
-                try:
-                    tz = pytz.timezone(target_timezone)
-                except pytz.UnknownTimeZoneError:
+    async def _get_time(
+        self,
+        timezone: str,
+        format: Optional[str] = Query(
+            default=DEFAULT_TIME_FORMAT, description="Time format"
+        ),
+    ) -> Response:
+        """Get current time for specified timezone"""
+        try:
+            # UTC/GMT skip the country lookup and the tz database
+            target_timezone = timezone.upper()
+            if target_timezone not in UTC_ZONES:
+                resolved = resolve_timezone(timezone)
+                if resolved is None:
                     raise HTTPException(
                         status_code=400,
-                        detail=f"Invalid timezone: {timezone}. Use /timezones endpoint to see available timezones."
+                        detail=f"Invalid timezone: {timezone}. Use /timezones endpoint to see available timezones.",
                     )
+                target_timezone = resolved
 
-                # Get current time
-                utc_now = datetime.utcnow().replace(tzinfo=pytz.UTC)
-                local_time = utc_now.astimezone(tz)
-                
-                # Prepare response data
-                time_data = {
-                    "timezone": target_timezone,
-                    "current_time": local_time.strftime(format),
-                    "timezone_name": local_time.strftime("%Z"),
-                    "utc_offset": local_time.strftime("%z"),
-                    "timestamp": int(local_time.timestamp()),
-                    "iso_string": local_time.isoformat(),
-                }
-
-                return JSONResponse(content=time_data)
-
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Error getting time for {timezone}: {e}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Failed to get current time: {str(e)}"
-                )
+            # Get current time
+            epoch = int(time.time())
+            current_time, timezone_name, utc_offset, iso_string = format_time(
+                target_timezone, format, epoch
+            )
+
+            # Prepare response data
+            time_data = TimeData(
+                timezone=target_timezone,
+                current_time=current_time,
+                timezone_name=timezone_name,
+                utc_offset=utc_offset,
+                timestamp=epoch,
+                iso_string=iso_string,
+            )
+
+            return Response(
+                content=_TIME_DATA_ENCODER.encode(time_data),
+                media_type="application/json",
+            )
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting time for {timezone}: {e}")
+            raise HTTPException(
+                status_code=500, detail=f"Failed to get current time: {str(e)}"
+            )
 
-        @self.app.get("/timezones")
-        async def list_timezones(
-            country: Optional[str] = Query(default=None, description="Country name to filter timezones")
-        ) -> JSONResponse:
-            """List available timezones"""
-            try:
-                if country:
-                    timezones = self._get_timezones_by_country(country)
-                else:
-                    timezones = pytz.all_timezones
-
-                timezone_list = sorted(list(timezones))
-
-                timezone_data = {
-                    "query": country or "all",
-                    "total_timezones": len(timezone_list),
-                    "timezones": timezone_list,
-                }
-
-                return JSONResponse(content=timezone_data)
-
-            except Exception as e:
-                logger.error(f"Error listing timezones: {e}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Failed to list timezones: {str(e)}"
+    async def _list_timezones(
+        self,
+        request: Request,
+        country: Optional[str] = Query(
+            default=None, description="Country name to filter timezones"
+        ),
+    ) -> Response:
+        """List available timezones"""
+        try:
+            if not country:
+                # The full listing never changes while the process runs
+                headers = _all_timezones_headers()
+                if_none_match = request.headers.get("if-none-match")
+                if if_none_match and _etag_matches(if_none_match, headers["ETag"]):
+                    # GZipMiddleware adds Vary to the 200 but leaves the 304 alone
+                    return Response(
+                        status_code=304, headers={**headers, "Vary": "Accept-Encoding"}
+                    )
+                return Response(
+                    content=_all_timezones_body(),
+                    media_type="application/json",
+                    headers=headers,
                 )
 
-        @self.app.post("/mcp")
-        async def mcp_endpoint(request: Request) -> JSONResponse:
-            """MCP protocol endpoint for VS Code extension"""
-            try:
-                body = await request.json()
-                logger.info(f"Received MCP request: {body}")
-                
-                # Handle MCP JSON-RPC 2.0 protocol
-                if "method" not in body:
-                    return JSONResponse(
+            timezones = get_timezones_by_country(country.lower())
+            timezone_list = sorted(timezones)
+
+            timezone_data = {
+                "query": country,
+                "total_timezones": len(timezone_list),
+                "timezones": timezone_list,
+            }
+
+            return Response(
+                content=orjson.dumps(timezone_data), media_type="application/json"
+            )
+
+        except Exception as e:
+            logger.error(f"Error listing timezones: {e}")
+            raise HTTPException(
+                status_code=500, detail=f"Failed to list timezones: {str(e)}"
+            )
+
+    async def _mcp_endpoint(self, request: Request) -> Response:
+        """MCP protocol endpoint for VS Code extension"""
+        body: Any = None
+        try:
+            body = await request.json()
+            logger.debug("Received MCP request: %s", body)
+
+            # JSON-RPC 2.0 batch: answer every call in a single round-trip
+            if isinstance(body, list):
+                if not body:
+                    return ORJSONResponse(
                         status_code=400,
-                        content={"error": {"code": -32600, "message": "Invalid Request"}}
+                        content=self._mcp_error(None, -32600, "Invalid Request"),
                     )
-                
-                method = body["method"]
-                params = body.get("params", {})
-                request_id = body.get("id")
-                
-                if method == "initialize":
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "protocolVersion": "2024-11-05",
-                            "capabilities": {
-                                "tools": {}
-                            },
-                            "serverInfo": {
-                                "name": "time-mcp-server",
-                                "version": "1.0.0"
-                            }
-                        }
-                    }
-                elif method == "tools/list":
-                    tools = [
-                        {
-                            "name": "get_current_time",
-                            "description": "Get the current time for a specified timezone or country",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "timezone": {
-                                        "type": "string",
-                                        "description": "Timezone name (e.g., 'Asia/Tokyo', 'America/New_York') or country name (e.g., 'Japan', 'United States')",
-                                    },
-                                    "format": {
-                                        "type": "string",
-                                        "description": "Time format (optional, defaults to '%Y-%m-%d %H:%M:%S')",
-                                        "default": "%Y-%m-%d %H:%M:%S",
-                                    },
-                                },
-                                "required": ["timezone"],
-                            },
-                        },
-                        {
-                            "name": "list_timezones",
-                            "description": "List available timezones for a specific country or region",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "country": {
-                                        "type": "string",
-                                        "description": "Country name or country code to filter timezones (optional)",
-                                    },
-                                },
-                            },
-                        },
-                    ]
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "tools": tools
-                        }
-                    }
-                elif method == "tools/call":
-                    tool_name = params.get("name")
-                    arguments = params.get("arguments", {})
-                    
+
+                responses = []
+                for message in body:
+                    if _is_notification(message):
+                        continue
                     try:
-                        if tool_name == "get_current_time":
-                            result = await self._handle_mcp_get_current_time(arguments)
-                        elif tool_name == "list_timezones":
-                            result = await self._handle_mcp_list_timezones(arguments)
-                        else:
-                            raise ValueError(f"Unknown tool: {tool_name}")
-                        
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "result": {
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": result
-                                    }
-                                ]
-                            }
-                        }
+                        responses.append(self._process_mcp_message(message))
                     except Exception as e:
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "error": {
-                                "code": -32603,
-                                "message": f"Internal error: {str(e)}"
-                            }
-                        }
-                else:
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "error": {
-                            "code": -32601,
-                            "message": f"Method not found: {method}"
-                        }
-                    }
-                
-                logger.info(f"Sending MCP response: {response}")
-                return JSONResponse(content=response)
-                
-            except Exception as e:
-                logger.error(f"Error in MCP endpoint: {e}")
-                return JSONResponse(
-                    status_code=500,
-                    content={
-                        "jsonrpc": "2.0",
-                        "id": body.get("id") if 'body' in locals() else None,
-                        "error": {
-                            "code": -32603,
-                            "message": f"Internal error: {str(e)}"
-                        }
-                    }
+                        logger.error(f"Error in MCP batch entry: {e}")
+                        message_id = (
+                            message.get("id") if isinstance(message, dict) else None
+                        )
+                        responses.append(
+                            _dumps(
+                                self._mcp_error(
+                                    message_id, -32603, f"Internal error: {str(e)}"
+                                )
+                            )
+                        )
+                if not responses:
+                    return Response(status_code=202)
+                content = b"[" + b",".join(responses) + b"]"
+                logger.debug("Sending MCP response: %s", content)
+                return Response(content=content, media_type="application/json")
+
+            # Handle MCP JSON-RPC 2.0 protocol
+            if not isinstance(body, dict) or "method" not in body:
+                return ORJSONResponse(
+                    status_code=400,
+                    content={"error": {"code": -32600, "message": "Invalid Request"}},
                 )
 
-    def _get_timezones_by_country(self, country: str) -> List[str]:
-        """Get timezones for a specific country"""
-        country_mappings = {
-            "utc": ["UTC"],
-            "gmt": ["GMT", "UTC"],
-            "japan": ["Asia/Tokyo"],
-            "united states": [
-                "America/New_York", "America/Chicago", "America/Denver", 
-                "America/Los_Angeles", "America/Anchorage", "Pacific/Honolulu"
-            ],
-            "usa": [
-                "America/New_York", "America/Chicago", "America/Denver", 
-                "America/Los_Angeles", "America/Anchorage", "Pacific/Honolulu"
-            ],
-            "china": ["Asia/Shanghai", "Asia/Hong_Kong"],
-            "united kingdom": ["Europe/London"],
-            "uk": ["Europe/London"],
-            "germany": ["Europe/Berlin"],
-            "france": ["Europe/Paris"],
-            "italy": ["Europe/Rome"],
-            "spain": ["Europe/Madrid"],
-            "australia": [
-                "Australia/Sydney", "Australia/Melbourne", "Australia/Perth", 
-                "Australia/Adelaide", "Australia/Darwin"
-            ],
-            "canada": [
-                "America/Toronto", "America/Vancouver", "America/Edmonton", 
-                "America/Winnipeg", "America/Halifax"
-            ],
-            "india": ["Asia/Kolkata", "Asia/Mumbai"],
-            "brazil": ["America/Sao_Paulo"],
-            "russia": ["Europe/Moscow"],
-            "south korea": ["Asia/Seoul"],
-            "korea": ["Asia/Seoul"],
-            "mexico": ["America/Mexico_City"],
-            "argentina": ["America/Buenos_Aires"],
-            "egypt": ["Africa/Cairo"],
-            "south africa": ["Africa/Johannesburg"],
-            "new zealand": ["Pacific/Auckland"],
-            "singapore": ["Asia/Singapore"],
-            "thailand": ["Asia/Bangkok"],
-            "indonesia": ["Asia/Jakarta"],
-            "pakistan": ["Asia/Karachi"],
-            "uae": ["Asia/Dubai"],
-            "netherlands": ["Europe/Amsterdam"],
-            "belgium": ["Europe/Brussels"],
-            "austria": ["Europe/Vienna"],
-            "switzerland": ["Europe/Zurich"],
-            "sweden": ["Europe/Stockholm"],
-            "norway": ["Europe/Oslo"],
-            "denmark": ["Europe/Copenhagen"],
-            "finland": ["Europe/Helsinki"],
-            "turkey": ["Europe/Istanbul"],
-            "greece": ["Europe/Athens"],
-            "peru": ["America/Lima"],
-            "colombia": ["America/Bogota"],
-            "chile": ["America/Santiago"],
-            "venezuela": ["America/Caracas"],
-            "nigeria": ["Africa/Lagos"],
-            "kenya": ["Africa/Nairobi"],
-            "morocco": ["Africa/Casablanca"],
+            if _is_notification(body):
+                return Response(status_code=202)
+
+            content = self._process_mcp_message(body)
+            logger.debug("Sending MCP response: %s", content)
+            return Response(content=content, media_type="application/json")
+
+        except Exception as e:
+            logger.error(f"Error in MCP endpoint: {e}")
+            return ORJSONResponse(
+                status_code=500,
+                content=self._mcp_error(
+                    body.get("id") if isinstance(body, dict) else None,
+                    -32603,
+                    f"Internal error: {str(e)}",
+                ),
+            )
+
+    def _process_mcp_message(self, message: Any) -> bytes:
+        """Handle a single JSON-RPC message and return the encoded response"""
+        if not isinstance(message, dict) or "method" not in message:
+            message_id = message.get("id") if isinstance(message, dict) else None
+            return _dumps(self._mcp_error(message_id, -32600, "Invalid Request"))
+
+        method = message["method"]
+        request_id = message.get("id")
+
+        handler = self._mcp_handlers.get(method) if isinstance(method, str) else None
+        if handler is None:
+            return _dumps(
+                self._mcp_error(request_id, -32601, f"Method not found: {method}")
+            )
+
+        return handler(message.get("params", {}), request_id)
+
+    def _handle_mcp_initialize(self, params: Dict[str, Any], request_id: Any) -> bytes:
+        """Handle MCP initialize request"""
+        return self._prebuilt_result(request_id, _INIT_RESULT_JSON)
+
+    def _handle_mcp_tools_list(self, params: Dict[str, Any], request_id: Any) -> bytes:
+        """Handle MCP tools/list request"""
+        return self._prebuilt_result(request_id, _TOOLS_RESULT_JSON)
+
+    def _handle_mcp_tools_call(self, params: Dict[str, Any], request_id: Any) -> bytes:
+        """Handle MCP tools/call request"""
+        tool_name = params.get("name")
+        arguments = params.get("arguments", {})
+
+        try:
+            if tool_name == "get_current_time":
+                result = self._handle_mcp_get_current_time(arguments)
+            elif tool_name == "list_timezones":
+                result = self._handle_mcp_list_timezones(arguments)
+            else:
+                raise ValueError(f"Unknown tool: {tool_name}")
+
+            response = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "result": {"content": [{"type": "text", "text": result}]},
+            }
+        except Exception as e:
+            response = self._mcp_error(request_id, -32603, f"Internal error: {str(e)}")
+
+        return _dumps(response)
+
+    def _mcp_error(self, request_id: Any, code: int, message: str) -> Dict[str, Any]:
+        """Build a JSON-RPC error response"""
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
         }
 
-        normalized_country = country.lower()
-        
-        # Direct mapping
-        if normalized_country in country_mappings:
-            return country_mappings[normalized_country]
-
-        # Extended timezone list for fallback search
-        extended_timezones = [
-            "UTC", "GMT",
-            "Asia/Tokyo", "Asia/Seoul", "Asia/Shanghai", "Asia/Hong_Kong", "Asia/Singapore",
-            "Asia/Bangkok", "Asia/Jakarta", "Asia/Kolkata", "Asia/Mumbai", "Asia/Dubai",
-            "Asia/Karachi", "Australia/Sydney", "Australia/Melbourne", "Australia/Perth",
-            "Australia/Adelaide", "Australia/Darwin", "Pacific/Auckland", "Pacific/Honolulu",
-            "Europe/London", "Europe/Berlin", "Europe/Paris", "Europe/Rome", "Europe/Madrid",
-            "Europe/Amsterdam", "Europe/Brussels", "Europe/Vienna", "Europe/Zurich",
-            "Europe/Stockholm", "Europe/Oslo", "Europe/Copenhagen", "Europe/Helsinki",
-            "Europe/Moscow", "Europe/Istanbul", "Europe/Athens",
-            "America/New_York", "America/Chicago", "America/Denver", "America/Los_Angeles",
-            "America/Anchorage", "America/Toronto", "America/Vancouver", "America/Edmonton",
-            "America/Winnipeg", "America/Halifax", "America/Mexico_City",
-            "America/Sao_Paulo", "America/Buenos_Aires", "America/Lima", "America/Bogota",
-            "America/Santiago", "America/Caracas",
-            "Africa/Cairo", "Africa/Lagos", "Africa/Johannesburg", "Africa/Casablanca",
-            "Africa/Nairobi"
-        ]
-
-        # Search in timezone names
-        return [
-            tz for tz in extended_timezones            if normalized_country in tz.lower() or country.lower() in tz.lower()
-        ]
-
-    async def _handle_mcp_get_current_time(self, args: Dict[str, Any]) -> str:
+    def _prebuilt_result(self, request_id: Any, result_json: bytes) -> bytes:
+        """Wrap a pre-serialized JSON-RPC result, encoding only the request id"""
+        return (
+            b'{"jsonrpc":"2.0","id":'
+            + _dumps(request_id)
+            + b',"result":'
+            + result_json
+            + b"}"
+        )
+
+    def _handle_mcp_get_current_time(self, args: Dict[str, Any]) -> str:
         """Handle MCP get_current_time request"""
         timezone_input = args.get("timezone")
-        time_format = args.get("format", "%Y-%m-%d %H:%M:%S")
+        time_format = args.get("format", DEFAULT_TIME_FORMAT)
 
         if not timezone_input:
             raise ValueError("Timezone parameter is required")
 
-        # Try to find timezone by name or country
-        target_timezone = timezone_input
-        
-        # If it's a country name, try to get the main timezone
-        country_timezones = self._get_timezones_by_country(timezone_input)
-        if country_timezones:
-            target_timezone = country_timezones[0]
-
-        # Validate timezone
-        try:
-            tz = pytz.timezone(target_timezone)
-        except pytz.UnknownTimeZoneError:
+        target_timezone = resolve_timezone(timezone_input)
+        if target_timezone is None:
             raise ValueError(
                 f"Invalid timezone: {timezone_input}. Use list_timezones tool to see available timezones."
             )
 
-        # Get current time
-        utc_now = datetime.utcnow().replace(tzinfo=pytz.UTC)
-        local_time = utc_now.astimezone(tz)
-        
-        # Prepare response data
-        time_data = {
-            "timezone": target_timezone,
-            "current_time": local_time.strftime(time_format),
-            "timezone_name": local_time.strftime("%Z"),
-            "utc_offset": local_time.strftime("%z"),
-            "timestamp": int(local_time.timestamp()),
-            "iso_string": local_time.isoformat(),
-        }
-
-        return json.dumps(time_data, indent=2, ensure_ascii=False)
+        return current_time_text(target_timezone, time_format, int(time.time()))
 
-    async def _handle_mcp_list_timezones(self, args: Dict[str, Any]) -> str:
+    def _handle_mcp_list_timezones(self, args: Dict[str, Any]) -> str:
         """Handle MCP list_timezones request"""
         country = args.get("country")
 
-        if country:
-            timezones = self._get_timezones_by_country(country)
-        else:
-            timezones = pytz.all_timezones
+        if not country:
+            return all_timezones_json()
 
-        timezone_list = sorted(list(timezones))
+        timezones = get_timezones_by_country(country.lower())
+        timezone_list = sorted(timezones)
 
         timezone_data = {
-            "query": country or "all",
+            "query": country,
             "total_timezones": len(timezone_list),
             "timezones": timezone_list,
         }
 
-        return json.dumps(timezone_data, indent=2, ensure_ascii=False)
+        return orjson.dumps(timezone_data, option=orjson.OPT_INDENT_2).decode()
 
 
 def create_app() -> FastAPI:
@@ -432,7 +486,9 @@ app = create_app()
 if __name__ == "__main__":
     import os
     import uvicorn
-    
+
     app = create_app()
     port = int(os.getenv("PORT", "8080"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvicorn[standard] ships httptools and, where supported, uvloop
+    # (selected by the default loop="auto"); skip per-request access logging
+    uvicorn.run(app, host="0.0.0.0", port=port, http="httptools", access_log=False)
@@ -13,40 +13,63 @@ def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Time MCP Server")
     parser.add_argument(
-        "--http", 
-        action="store_true", 
-        help="Run as HTTP server instead of MCP server"
+        "--http", action="store_true", help="Run as HTTP server instead of MCP server"
     )
     parser.add_argument(
-        "--port", 
-        type=int, 
-        default=int(os.getenv("PORT", "8080")), 
-        help="Port for HTTP server (default: 8080, or PORT environment variable)"
+        "--port",
+        type=int,
+        default=int(os.getenv("PORT", "8080")),
+        help="Port for HTTP server (default: 8080, or PORT environment variable)",
     )
     parser.add_argument(
         "--host",
         type=str,
         default=os.getenv("HOST", "0.0.0.0"),
-        help="Host for HTTP server (default: 0.0.0.0, or HOST environment variable)"
+        help="Host for HTTP server (default: 0.0.0.0, or HOST environment variable)",
     )
     parser.add_argument(
-        "--standalone", 
-        action="store_true",        help="Run standalone version for testing"
+        "--workers",
+        type=int,
+        help="Number of HTTP worker processes (default: 1, or WEB_CONCURRENCY environment variable)",
     )
-    
+    parser.add_argument(
+        "--standalone", action="store_true", help="Run standalone version for testing"
+    )
+
     args = parser.parse_args()
-    
+
     if args.standalone:
         from .standalone import main as standalone_main
+
         asyncio.run(standalone_main())
     elif args.http:
+        workers = args.workers
+        if workers is None:
+            try:
+                workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+            except ValueError:
+                parser.error(
+                    f"invalid WEB_CONCURRENCY value: {os.getenv('WEB_CONCURRENCY')!r}"
+                )
         try:
             import uvicorn
-            
+
             # Use the app string for uvicorn to enable workers and reload
             app_str = "time_mcp_server.http_server:app"
-            print(f"Starting HTTP server on {args.host}:{args.port}")
-            uvicorn.run(app_str, host=args.host, port=args.port, reload=False)
+            print(
+                f"Starting HTTP server on {args.host}:{args.port} ({workers} workers)"
+            )
+            # httptools parser; loop="auto" picks uvloop when it is installed
+            uvicorn.run(
+                app_str,
+                host=args.host,
+                port=args.port,
+                reload=False,
+                workers=workers,
+                http="httptools",
+                limit_concurrency=1000,
+                timeout_keep_alive=30,
+            )
         except ImportError as e:
             print(f"HTTP server dependencies not available: {e}")
             print("Install with: pip install fastapi uvicorn")
@@ -54,11 +77,13 @@ def main():
     else:
         try:
             from .server import main as server_main
+
             asyncio.run(server_main())
         except ImportError as e:
             print(f"MCP server dependencies not available: {e}")
             print("Falling back to standalone mode...")
             from .standalone import main as standalone_main
+
             asyncio.run(standalone_main())
 
 
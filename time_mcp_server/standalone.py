@@ -7,14 +7,59 @@ A simple time server that can work without MCP dependencies for testing.
 
 import asyncio
 import json
+import os
 import sys
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Tuple
+
+from ._country_data import COUNTRY_TIMEZONES
+from ._time_format import DEFAULT_TIME_FORMAT, fast_format
+
+
+def _precompute_offset(timezone: str, offset: float) -> Tuple[int, str, str]:
+    """Get (offset in seconds, UTC offset string, display name) for a fixed-offset timezone"""
+    hours_offset = int(offset)
+    minutes_offset = int((offset - hours_offset) * 60)
+
+    # Format offset string
+    sign = "+" if offset >= 0 else "-"
+    abs_offset = abs(offset)
+    offset_hours = int(abs_offset)
+    offset_minutes = int((abs_offset - offset_hours) * 60)
+    utc_offset = f"{sign}{offset_hours:02d}{offset_minutes:02d}"
+
+    return (
+        hours_offset * 3600 + minutes_offset * 60,
+        utc_offset,
+        timezone.split("/")[-1],
+    )
+
+
+def _local_time(utc_epoch_second: int, offset_seconds: int) -> datetime:
+    """Naive local time for a UTC epoch second (simplified, doesn't handle DST properly)"""
+    return datetime.fromtimestamp(
+        utc_epoch_second + offset_seconds, dt_timezone.utc
+    ).replace(tzinfo=None)
+
+
+# Keys of a get_current_time result, in output order
+TIME_FIELDS = (
+    "timezone",
+    "current_time",
+    "timezone_name",
+    "utc_offset",
+    "timestamp",
+    "iso_string",
+)
+_TIME_FIELD_SET = frozenset(TIME_FIELDS)
+
 
 # Fallback timezone implementation without pytz
 class SimpleTimezone:
     """Simple timezone implementation using standard library"""
-    
+
     TIMEZONE_OFFSETS = {
         "UTC": 0,
         "GMT": 0,
@@ -76,235 +121,318 @@ class SimpleTimezone:
         "Africa/Nairobi": 3,
     }
 
+    # Offsets are fixed, so everything derived from them is computed once
+    _PRECOMPUTED = {
+        tz: _precompute_offset(tz, offset) for tz, offset in TIMEZONE_OFFSETS.items()
+    }
+    _SORTED_TIMEZONES = tuple(sorted(TIMEZONE_OFFSETS))
+
     @classmethod
     def get_timezone_offset(cls, timezone: str) -> Optional[float]:
         """Get timezone offset in hours"""
         return cls.TIMEZONE_OFFSETS.get(timezone)
 
     @classmethod
-    def get_current_time(cls, timezone: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> Dict[str, Any]:
-        """Get current time for timezone"""
-        offset = cls.get_timezone_offset(timezone)
-        if offset is None:
+    def get_current_time(
+        cls,
+        timezone: str,
+        format_str: str = DEFAULT_TIME_FORMAT,
+        utc_epoch_second: Optional[int] = None,
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get current time for timezone, or its time at utc_epoch_second if given
+
+        If fields is given, only those keys are computed and returned.
+        """
+        if timezone not in cls.TIMEZONE_OFFSETS:
             raise ValueError(f"Unknown timezone: {timezone}")
-        
-        utc_now = datetime.utcnow()
-        
-        # Calculate local time (simplified, doesn't handle DST properly)
-        hours_offset = int(offset)
-        minutes_offset = int((offset - hours_offset) * 60)
-        
-        import datetime as dt
-        local_time = utc_now + dt.timedelta(hours=hours_offset, minutes=minutes_offset)
-        
-        # Format offset string
-        sign = "+" if offset >= 0 else "-"
-        abs_offset = abs(offset)
-        offset_hours = int(abs_offset)
-        offset_minutes = int((abs_offset - offset_hours) * 60)
-        utc_offset = f"{sign}{offset_hours:02d}{offset_minutes:02d}"
-        
+
+        if utc_epoch_second is None:
+            utc_epoch_second = int(time.time())
+
+        if fields is not None:
+            return cls._select_fields(timezone, format_str, utc_epoch_second, fields)
+
+        # Calls within the same second share the formatted fields
+        current_time, timezone_name, utc_offset, timestamp, iso_string = cls._compute(
+            timezone, format_str, utc_epoch_second
+        )
+
         return {
             "timezone": timezone,
-            "current_time": local_time.strftime(format_str),
-            "timezone_name": timezone.split("/")[-1],
+            "current_time": current_time,
+            "timezone_name": timezone_name,
             "utc_offset": utc_offset,
-            "timestamp": int(local_time.timestamp()),
-            "iso_string": local_time.isoformat(),
+            "timestamp": timestamp,
+            "iso_string": iso_string,
         }
 
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _compute(
+        timezone: str, format_str: str, utc_epoch_second: int
+    ) -> Tuple[str, str, str, int, str]:
+        """Get the formatted time fields for a known timezone at a UTC epoch second"""
+        offset_seconds, utc_offset, timezone_name = SimpleTimezone._PRECOMPUTED[
+            timezone
+        ]
+        local_time = _local_time(utc_epoch_second, offset_seconds)
+
+        return (
+            fast_format(local_time, format_str),
+            timezone_name,
+            utc_offset,
+            utc_epoch_second,
+            local_time.isoformat(),
+        )
+
+    @classmethod
+    def _select_fields(
+        cls,
+        timezone: str,
+        format_str: str,
+        utc_epoch_second: int,
+        fields: AbstractSet[str],
+    ) -> Dict[str, Any]:
+        """Build only the requested time fields, in the usual key order"""
+        unknown = set(fields) - _TIME_FIELD_SET
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+        offset_seconds, utc_offset, timezone_name = cls._PRECOMPUTED[timezone]
+        current_time: Optional[str] = None
+        iso_string: Optional[str] = None
+        if "current_time" in fields or "iso_string" in fields:
+            local_time = _local_time(utc_epoch_second, offset_seconds)
+            if "current_time" in fields:
+                current_time = fast_format(local_time, format_str)
+            if "iso_string" in fields:
+                iso_string = local_time.isoformat()
+
+        result: Dict[str, Any] = {}
+        for field in TIME_FIELDS:
+            if field not in fields:
+                continue
+            if field == "timezone":
+                result[field] = timezone
+            elif field == "current_time":
+                result[field] = current_time
+            elif field == "timezone_name":
+                result[field] = timezone_name
+            elif field == "utc_offset":
+                result[field] = utc_offset
+            elif field == "timestamp":
+                result[field] = utc_epoch_second
+            else:
+                result[field] = iso_string
+        return result
+
     @classmethod
     def list_timezones(cls) -> List[str]:
         """List all available timezones"""
-        return sorted(cls.TIMEZONE_OFFSETS.keys())
+        return list(cls._SORTED_TIMEZONES)
+
+
+# Lowercased names searched when a country isn't in COUNTRY_TIMEZONES
+_TZ_LOWER: Tuple[Tuple[str, str], ...] = tuple(
+    (tz, tz.lower()) for tz in SimpleTimezone.list_timezones()
+)
+
+# Appended to unknown-timezone errors, quoting the first few names
+_UNKNOWN_TIMEZONE_HINT = (
+    ". Available timezones include: "
+    + ", ".join(SimpleTimezone.list_timezones()[:10])
+    + "..."
+)
+
+
+@lru_cache(maxsize=256)
+def _search_timezones_for_country(normalized_country: str) -> Tuple[str, ...]:
+    """Search timezone names containing a lowercase country name, memoized per name"""
+    return tuple(tz for tz, tz_lower in _TZ_LOWER if normalized_country in tz_lower)
 
 
 class TimeServerStandalone:
     """Standalone time server implementation"""
 
+    __slots__ = ("timezone_helper", "_pretty", "_handlers", "_tools")
+
     def __init__(self):
         self.timezone_helper = SimpleTimezone()
+        # Tool results are compact JSON unless TIME_MCP_PRETTY is set (e.g. for debugging)
+        self._pretty = os.getenv("TIME_MCP_PRETTY", "").lower() in ("1", "true", "yes")
+        # Tool name -> handler returning the result dict
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "get_current_time": self._handle_get_current_time,
+            "list_timezones": self._handle_list_timezones,
+        }
+        # Returned as-is by get_tools
+        self._tools: List[Dict[str, Any]] = [
+            {
+                "name": "get_current_time",
+                "description": "Get the current time for a specified timezone or country",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "timezone": {
+                            "type": "string",
+                            "description": "Timezone name (e.g., 'Asia/Tokyo', 'America/New_York') or country name (e.g., 'Japan', 'United States')",
+                        },
+                        "format": {
+                            "type": "string",
+                            "description": "Time format (optional, defaults to '%Y-%m-%d %H:%M:%S')",
+                            "default": "%Y-%m-%d %H:%M:%S",
+                        },
+                    },
+                    "required": ["timezone"],
+                },
+            },
+            {
+                "name": "list_timezones",
+                "description": "List available timezones for a specific country or region",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "country": {
+                            "type": "string",
+                            "description": "Country name or country code to filter timezones (optional)",
+                        },
+                    },
+                },
+            },
+        ]
 
     def get_timezones_by_country(self, country: str) -> List[str]:
         """Get timezones for a specific country"""
-        country_mappings = {
-            "utc": ["UTC"],
-            "gmt": ["GMT", "UTC"],
-            "japan": ["Asia/Tokyo"],
-            "united states": [
-                "America/New_York", "America/Chicago", "America/Denver", 
-                "America/Los_Angeles", "America/Anchorage", "Pacific/Honolulu"
-            ],
-            "usa": [
-                "America/New_York", "America/Chicago", "America/Denver", 
-                "America/Los_Angeles", "America/Anchorage", "Pacific/Honolulu"
-            ],
-            "china": ["Asia/Shanghai", "Asia/Hong_Kong"],
-            "united kingdom": ["Europe/London"],
-            "uk": ["Europe/London"],
-            "germany": ["Europe/Berlin"],
-            "france": ["Europe/Paris"],
-            "italy": ["Europe/Rome"],
-            "spain": ["Europe/Madrid"],
-            "australia": [
-                "Australia/Sydney", "Australia/Melbourne", "Australia/Perth", 
-                "Australia/Adelaide", "Australia/Darwin"
-            ],
-            "canada": [
-                "America/Toronto", "America/Vancouver", "America/Edmonton", 
-                "America/Winnipeg", "America/Halifax"
-            ],
-            "india": ["Asia/Kolkata", "Asia/Mumbai"],
-            "brazil": ["America/Sao_Paulo"],
-            "russia": ["Europe/Moscow"],
-            "south korea": ["Asia/Seoul"],
-            "korea": ["Asia/Seoul"],
-            "mexico": ["America/Mexico_City"],
-            "argentina": ["America/Buenos_Aires"],
-            "egypt": ["Africa/Cairo"],
-            "south africa": ["Africa/Johannesburg"],
-            "new zealand": ["Pacific/Auckland"],
-            "singapore": ["Asia/Singapore"],
-            "thailand": ["Asia/Bangkok"],
-            "indonesia": ["Asia/Jakarta"],
-            "pakistan": ["Asia/Karachi"],
-            "uae": ["Asia/Dubai"],
-            "netherlands": ["Europe/Amsterdam"],
-            "belgium": ["Europe/Brussels"],
-            "austria": ["Europe/Vienna"],
-            "switzerland": ["Europe/Zurich"],
-            "sweden": ["Europe/Stockholm"],
-            "norway": ["Europe/Oslo"],
-            "denmark": ["Europe/Copenhagen"],
-            "finland": ["Europe/Helsinki"],
-            "turkey": ["Europe/Istanbul"],
-            "greece": ["Europe/Athens"],
-            "peru": ["America/Lima"],
-            "colombia": ["America/Bogota"],
-            "chile": ["America/Santiago"],
-            "venezuela": ["America/Caracas"],
-            "nigeria": ["Africa/Lagos"],
-            "kenya": ["Africa/Nairobi"],
-            "morocco": ["Africa/Casablanca"],
-        }
-
         normalized_country = country.lower()
-        
+
         # Direct mapping
-        if normalized_country in country_mappings:
-            return country_mappings[normalized_country]
+        if normalized_country in COUNTRY_TIMEZONES:
+            return list(COUNTRY_TIMEZONES[normalized_country])
 
         # Search in timezone names
-        all_timezones = self.timezone_helper.list_timezones()
+        return list(_search_timezones_for_country(normalized_country))
+
+    def get_current_time(
+        self,
+        timezone_input: str,
+        format_str: str = DEFAULT_TIME_FORMAT,
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get current time for timezone or country, limited to fields if given"""
+        return self._current_time(timezone_input, format_str, int(time.time()), fields)
+
+    def get_current_times(
+        self,
+        timezone_inputs: List[str],
+        format_str: str = DEFAULT_TIME_FORMAT,
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get current time for several timezones or countries from a single clock read"""
+        utc_epoch_second = int(time.time())
         return [
-            tz for tz in all_timezones 
-            if normalized_country in tz.lower() or country.lower() in tz.lower()
+            self._current_time(timezone_input, format_str, utc_epoch_second, fields)
+            for timezone_input in timezone_inputs
         ]
 
-    def get_current_time(self, timezone_input: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> Dict[str, Any]:
-        """Get current time for timezone or country"""
+    def _current_time(
+        self,
+        timezone_input: str,
+        format_str: str,
+        utc_epoch_second: int,
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get the time for timezone or country at a UTC epoch second"""
         if not timezone_input:
             raise ValueError("Timezone parameter is required")
 
+        # Known timezone names need no country lookup
+        if timezone_input in SimpleTimezone.TIMEZONE_OFFSETS:
+            return self.timezone_helper.get_current_time(
+                timezone_input, format_str, utc_epoch_second, fields
+            )
+
         # Try to find timezone by name or country
         target_timezone = timezone_input
-        
+
         # If it's a country name, try to get the main timezone
         country_timezones = self.get_timezones_by_country(timezone_input)
         if country_timezones:
             target_timezone = country_timezones[0]
 
-        try:
-            return self.timezone_helper.get_current_time(target_timezone, format_str)
-        except ValueError as e:
-            available_timezones = self.timezone_helper.list_timezones()[:10]  # Show first 10
-            raise ValueError(f"{e}. Available timezones include: {', '.join(available_timezones)}...")
+        if target_timezone not in SimpleTimezone.TIMEZONE_OFFSETS:
+            raise ValueError(
+                f"Unknown timezone: {target_timezone}" + _UNKNOWN_TIMEZONE_HINT
+            )
+
+        return self.timezone_helper.get_current_time(
+            target_timezone, format_str, utc_epoch_second, fields
+        )
 
     def list_timezones(self, country: Optional[str] = None) -> Dict[str, Any]:
         """List available timezones"""
         if country:
-            timezones = self.get_timezones_by_country(country)
+            timezones = sorted(self.get_timezones_by_country(country))
         else:
+            # Already sorted
             timezones = self.timezone_helper.list_timezones()
 
         return {
             "query": country or "all",
             "total_timezones": len(timezones),
-            "timezones": sorted(timezones),
+            "timezones": timezones,
         }
 
     async def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Handle tool calls (simulating MCP interface)"""
+        return self.handle_tool_call_sync(tool_name, arguments)
+
+    def handle_tool_call_sync(self, tool_name: str, arguments: Dict[str, Any]) -> str:
+        """Handle tool calls without an event loop; the work involves no I/O"""
         try:
-            if tool_name == "get_current_time":
-                timezone = arguments.get("timezone")
-                format_str = arguments.get("format", "%Y-%m-%d %H:%M:%S")
-                result = self.get_current_time(timezone, format_str)
-                return json.dumps(result, indent=2, ensure_ascii=False)
-                
-            elif tool_name == "list_timezones":
-                country = arguments.get("country")
-                result = self.list_timezones(country)
-                return json.dumps(result, indent=2, ensure_ascii=False)
-                
-            else:
+            handler = self._handlers.get(tool_name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {tool_name}")
-                
+            return self._dumps(handler(arguments))
+
         except Exception as e:
             error_result = {"error": str(e)}
-            return json.dumps(error_result, indent=2, ensure_ascii=False)
+            return self._dumps(error_result)
+
+    def _dumps(self, data: Dict[str, Any]) -> str:
+        """Serialize a tool result"""
+        if self._pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False)
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    def _handle_get_current_time(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle get_current_time tool call"""
+        timezone = arguments.get("timezone")
+        format_str = arguments.get("format", DEFAULT_TIME_FORMAT)
+        return self.get_current_time(timezone, format_str)
+
+    def _handle_list_timezones(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle list_timezones tool call"""
+        return self.list_timezones(arguments.get("country"))
 
     def get_tools(self) -> List[Dict[str, Any]]:
         """Get available tools"""
-        return [
-            {
-                "name": "get_current_time",
-                "description": "Get the current time for a specified timezone or country",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "timezone": {
-                            "type": "string",
-                            "description": "Timezone name (e.g., 'Asia/Tokyo', 'America/New_York') or country name (e.g., 'Japan', 'United States')",
-                        },
-                        "format": {
-                            "type": "string",
-                            "description": "Time format (optional, defaults to '%Y-%m-%d %H:%M:%S')",
-                            "default": "%Y-%m-%d %H:%M:%S",
-                        },
-                    },
-                    "required": ["timezone"],
-                },
-            },
-            {
-                "name": "list_timezones",
-                "description": "List available timezones for a specific country or region",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "country": {
-                            "type": "string",
-                            "description": "Country name or country code to filter timezones (optional)",
-                        },
-                    },
-                },
-            },
-        ]
+        return self._tools
 
 
 async def main():
     """Main function for testing"""
     server = TimeServerStandalone()
-    
+
     # Test cases
     print("=== Time MCP Server (Standalone) ===\n")
-    
+
     print("Available tools:")
     tools = server.get_tools()
     for tool in tools:
         print(f"- {tool['name']}: {tool['description']}")
     print()
-    
+
     # Test get_current_time
     print("Testing get_current_time:")
     test_cases = [
@@ -313,12 +441,12 @@ async def main():
         {"timezone": "United States"},
         {"timezone": "UTC"},
     ]
-    
+
     for test_case in test_cases:
         print(f"Input: {test_case}")
-        result = await server.handle_tool_call("get_current_time", test_case)
+        result = server.handle_tool_call_sync("get_current_time", test_case)
         print(f"Output: {result}\n")
-    
+
     # Test list_timezones
     print("Testing list_timezones:")
     timezone_test_cases = [
@@ -326,10 +454,10 @@ async def main():
         {"country": "Japan"},
         {"country": "United States"},
     ]
-    
+
     for test_case in timezone_test_cases:
         print(f"Input: {test_case}")
-        result = await server.handle_tool_call("list_timezones", test_case)
+        result = server.handle_tool_call_sync("list_timezones", test_case)
         print(f"Output: {result}\n")
 
 